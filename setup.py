@@ -1,8 +1,6 @@
 #!/usr/bin/env python
-import re
 import sys
 from setuptools import setup, find_packages
-from subprocess import CalledProcessError, check_output
 
 PROJECT = "DeepSpectrum"
 VERSION = "0.6.6"
@@ -44,51 +42,14 @@ if not torch_found:
 
 try:
     import tensorflow
-
     tensorflow_found = True
 except ImportError:
     tensorflow_found = False
 
+# CUDA is not probed for at build time: install a matching tensorflow-gpu
+# before DeepSpectrum to extract on the gpu
 if not tensorflow_found:
-    # inspired by cmake's FindCUDA
-    nvcc_version_regex = re.compile(
-        "release (?P<major>[0-9]+)\\.(?P<minor>[0-9]+)")
-    use_gpu = False
-
-    try:
-        output = str(check_output(["nvcc", "--version"]))
-        version_string = nvcc_version_regex.search(output)
-
-        if version_string:
-            major = int(version_string.group("major"))
-            minor = int(version_string.group("minor"))
-            if major == 10 and minor == 0:
-                print("detected compatible CUDA version %d.%d" %
-                      (major, minor))
-                install_requires.append("tensorflow-gpu >=1.13.0, <2")
-                use_gpu = True
-
-            if major == 9:
-                print("detected compatible CUDA version %d.%d" %
-                      (major, minor))
-                install_requires.append("tensorflow-gpu==1.12.0")
-                use_gpu = True
-
-            else:
-                print("detected incompatible CUDA version %d.%d" %
-                      (major, minor))
-
-        else:
-            print("CUDA detected, but unable to parse version")
-    except CalledProcessError:
-        print("no CUDA detected")
-    except Exception as e:
-        print("error during CUDA detection: %s", e)
-
-    if not use_gpu:
-        install_requires.append("tensorflow >=1.13.0, <2")
-else:
-    pass
+    install_requires.append("tensorflow >=1.13.0, <2")
 
 tests_require = ['pytest>=4.4.1', 'pytest-cov>=2.7.1']
 needs_pytest = {'pytest', 'test', 'ptr'}.intersection(sys.argv)
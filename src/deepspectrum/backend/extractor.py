@@ -89,8 +89,12 @@ class KerasExtractor(Extractor):
                  model_key,
                  layer,
                  weights_path="imagenet",
-                 batch_size=256):
+                 batch_size=256,
+                 xla=False):
         super().__init__(images, batch_size)
+        if xla:
+            log.info('Enabling XLA JIT compilation.')
+            tf.keras.backend.set_session(_xla_session())
         self.models = {
             "vgg16":
             tf.keras.applications.vgg16.VGG16,
@@ -219,8 +223,12 @@ class PytorchExtractor(Extractor):
             [preprocess(Image.fromarray(image, mode="RGB")) for image in x])
         return x
 
-    def __init__(self, images, model_key, layer, batch_size=256):
+    def __init__(self, images, model_key, layer, batch_size=256, xla=False):
         super().__init__(images, batch_size)
+        if xla:
+            log.warning(
+                f'XLA is only available for keras networks. Ignoring --xla for {model_key}.'
+            )
         self.models = {
             "alexnet": models.alexnet,
             "squeezenet": models.squeezenet1_1,
@@ -297,6 +305,27 @@ class PytorchExtractor(Extractor):
                                            feature_batch))
 
 
+_XLA_SESSION = None
+
+
+def _xla_session():
+    """
+    Create a session with XLA auto-clustering enabled, or return the one created before so that repeated
+    extractor construction does not leak sessions.
+    """
+    global _XLA_SESSION
+    if _XLA_SESSION is None:
+        # the session config only auto-clusters on gpu, cpu needs the xla flag
+        xla_flags = os.environ.get("TF_XLA_FLAGS", "")
+        if "--tf_xla_cpu_global_jit" not in xla_flags:
+            os.environ["TF_XLA_FLAGS"] = (
+                xla_flags + " --tf_xla_cpu_global_jit").strip()
+        session_config = tf.ConfigProto()
+        session_config.graph_options.optimizer_options.global_jit_level = tf.OptimizerOptions.ON_1
+        _XLA_SESSION = tf.Session(config=session_config)
+    return _XLA_SESSION
+
+
 def _batch_images(images, batch_size=256):
     current_name_batch = []
     current_ts_batch = []
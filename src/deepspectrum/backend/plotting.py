@@ -260,12 +260,13 @@ def _generate_chunks(sound_info, sr, window, hop, start=0, wav_out=None):
         return
     window_samples = int(window * sr)
     hop_samples = int(hop * sr)
+    if wav_out:
+        makedirs(dirname(wav_out), exist_ok=True)
     for n in range(max(int((len(sound_info)) / hop_samples), 1)):
         chunk = sound_info[n *
                            hop_samples:min(n * hop_samples +
                                            window_samples, len(sound_info))]
         if wav_out:
-            makedirs(dirname(wav_out), exist_ok=True)
             chunk_out = f'{splitext(wav_out)[0]}_{(start + n * hop):g}.wav'
             librosa.output.write_wav(chunk_out, chunk, sr)
         yield chunk
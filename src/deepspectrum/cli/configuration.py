@@ -1,8 +1,6 @@
 import logging
 import click
 import configparser
-import fnmatch
-import re
 import decimal
 from enum import Enum
 from multiprocessing import cpu_count
@@ -203,6 +201,12 @@ EXTRACTION_OPTIONS = [
         "Maximum batch size for feature extraction. Adjust according to your gpu memory size.",
         default=128,
     ),
+    click.option(
+        "--xla/--no-xla",
+        default=False,
+        help=
+        "Enable XLA JIT compilation of the Keras extraction network on cpu and gpu. Can speed up extraction on some networks and hardware, but is not always faster. Ignored for pytorch networks.",
+    ),
 ]
 
 WRITER_OPTIONS = [
@@ -288,6 +292,7 @@ class Configuration:
             extraction_network="vgg16",
             feature_layer="fc7",
             batch_size=128,
+            xla=False,
             output=None,
             time_continuous=False,
             label_file=None,
@@ -344,6 +349,7 @@ class Configuration:
             self.net = extraction_network
             self.extraction_args["layer"] = feature_layer
             self.extraction_args["batch_size"] = batch_size
+            self.extraction_args["xla"] = xla
 
         self._load_config()
         self.files = self._find_files(input)
@@ -358,8 +364,9 @@ class Configuration:
         if self.writer:
             self.label_file = label_file
             self.writer_args["output"] = output
-            makedirs(dirname(abspath(self.writer_args["output"])),
-                     exist_ok=True)
+            output_folder = dirname(self.writer_args["output"])
+            if output_folder:
+                makedirs(output_folder, exist_ok=True)
             self.writer_args["continuous_labels"] = (
                 ("window" in self.plotting_args) and time_continuous
                 and self.label_file)
@@ -385,29 +392,28 @@ class Configuration:
             log.debug(f"{folder} is a single {self.file_type.value}-file.")
             return [folder]
 
+        # match all configured extensions in a single traversal of the tree
+        suffixes = tuple("." + file_type.lower()
+                         for file_type in self.file_type.value)
         input_files = []
-        for file_type in self.file_type.value:
-            globexpression = "*." + file_type
-            reg_expr = re.compile(fnmatch.translate(globexpression),
-                                  re.IGNORECASE)
-            log.debug(f"Searching {folder} for {file_type}-files.")
-            for root, dirs, files in walk(folder, topdown=True):
-                new_files = [
-                    join(root, j) for j in files if re.match(reg_expr, j)
-                ]
-                log.debug(
-                    f"Found {len(new_files)} {file_type}-files in {root}.")
-                input_files += new_files
+        log.debug(f"Searching {folder} for {self.file_type.value}-files.")
+        for root, dirs, files in walk(folder, topdown=True):
+            new_files = [
+                join(root, j) for j in files if j.lower().endswith(suffixes)
+            ]
+            log.debug(f"Found {len(new_files)} files in {root}.")
+            input_files += new_files
         log.debug(
             f"Found a total of {len(input_files)} {self.file_type.value}-files."
         )
         return sorted(input_files)
 
     def _files_to_extract(self, relative_paths_in_label_dict=True):
-        file_names = set(
-            map(
-                lambda f: get_relative_path(
-                    f, prefix=self.input_folder), self.files))
+        relative_paths = {
+            f: get_relative_path(f, prefix=self.input_folder)
+            for f in self.files
+        }
+        file_names = set(relative_paths.values())
         if not relative_paths_in_label_dict:
             self.writer_args["label_dict"] = {get_relative_path(
                     key, prefix=self.input_folder): value for key, value in self.writer_args["label_dict"].items()}
@@ -420,8 +426,7 @@ class Configuration:
             )
             self.files = [
                 file for file in self.files
-                if get_relative_path(
-                    file, prefix=self.input_folder) in self.writer_args["label_dict"]
+                if relative_paths[file] in self.writer_args["label_dict"]
             ]
         log.info(f'Extracting features for {len(self.files)} files.')
 
@@ -458,22 +463,25 @@ class Configuration:
         :return: Nothing
         """
         if self.writer_args["labels"] is None:
-            self.writer_args["label_dict"] = {
+            label_dict = {
                 get_relative_path(
                     f, prefix=self.input_folder): [basename(dirname(f))]
                 for f in self.files
             }
         else:
             # map the labels given on the commandline to all files in a given folder to all input files
-            self.writer_args["label_dict"] = {
+            explicit_label = str(self.writer_args["labels"])
+            label_dict = {
                 get_relative_path(f, prefix=self.input_folder):
-                [str(self.writer_args["labels"])]
+                [explicit_label]
                 for f in self.files
             }
-        labels = sorted(
-            list(map(lambda x: x[0], self.writer_args["label_dict"].values())))
+        self.writer_args["label_dict"] = label_dict
 
-        self.writer_args["labels"] = [("class", set(labels))]
+        self.writer_args["labels"] = [("class", {
+            label[0]
+            for label in label_dict.values()
+        })]
 
     def _load_config(self):
         """
@@ -519,7 +527,9 @@ class Configuration:
         else:
             log.info("Writing standard config to " + self.config)
 
-            makedirs(dirname(abspath(self.config)), exist_ok=True)
+            config_folder = dirname(self.config)
+            if config_folder:
+                makedirs(config_folder, exist_ok=True)
             # Read the defaul config file included in the package
             conf_parser.read(join(dirname(realpath(__file__)), "deep.conf"))
             with open(self.config, "w") as configfile:
@@ -23,3 +23,6 @@ class ArffWriter():
 
     def writerow(self, row):
         self.arff_file.write(','.join(row) + '\n')
+
+    def writerows(self, rows):
+        self.arff_file.writelines(','.join(row) + '\n' for row in rows)
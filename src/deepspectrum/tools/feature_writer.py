@@ -8,6 +8,8 @@ import logging
 
 log = logging.getLogger(__name__)
 
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class FeatureWriter:
     def __init__(self, output, label_dict, labels, continuous_labels,
@@ -33,12 +35,14 @@ class FeatureWriter:
 
 class ArffFeatureWriter(FeatureWriter):
     def write_features(self, names, features, hide_progress=False):
-        with open(self.output, 'w', newline='') as output_file, tqdm(
+        with open(self.output, 'w', newline='',
+                  buffering=WRITE_BUFFER_SIZE) as output_file, tqdm(
                 total=len(names),
                 disable=log.getEffectiveLevel() >= logging.ERROR) as pbar:
             writer = None
             first = True
             for batch in features:
+                rows = []
                 for feature_tuple in batch:
                     if first:
                         old_name = feature_tuple.name
@@ -65,22 +69,27 @@ class ArffFeatureWriter(FeatureWriter):
                     row += (list(map(str, feature_tuple.features)))
                     if not self.no_labels:
                         row += label
-                    writer.writerow(row)
+                    rows.append(row)
                     if feature_tuple.name != old_name:
                         pbar.update()
                         old_name = feature_tuple.name
                     del feature_tuple
+                # write all rows of an extraction batch at once
+                if rows:
+                    writer.writerows(rows)
             pbar.update()
 
 
 class CsvFeatureWriter(FeatureWriter):
     def write_features(self, names, features, hide_progress=False):
-        with open(self.output, 'w', newline='') as output_file, tqdm(
+        with open(self.output, 'w', newline='',
+                  buffering=WRITE_BUFFER_SIZE) as output_file, tqdm(
                 total=len(names),
                 disable=log.getEffectiveLevel() >= logging.ERROR) as pbar:
             writer = None
             first = True
             for batch in features:
+                rows = []
                 for feature_tuple in batch:
                     if first:
                         old_name = feature_tuple.name
@@ -108,10 +117,13 @@ class CsvFeatureWriter(FeatureWriter):
                     row += (list(map(str, feature_tuple.features)))
                     if not self.no_labels:
                         row += label
-                    writer.writerow(row)
+                    rows.append(row)
                     if feature_tuple.name != old_name:
                         pbar.update()
                         old_name = feature_tuple.name
+                # write all rows of an extraction batch at once
+                if rows:
+                    writer.writerows(rows)
             pbar.update()
 
 
@@ -1,7 +1,17 @@
 import csv
 import decimal
+import re
 from os.path import splitext, normpath
 
+READ_BUFFER_SIZE = 1 << 20
+
+# real number literals as accepted by float(), including nan, inf and
+# underscore digit separators
+_DIGITS = r'\d(?:_?\d)*'
+_NUMBER_RE = re.compile(
+    r'^\s*[+-]?(?:(?:{0}(?:\.(?:{0})?)?|\.{0})(?:e[+-]?{0})?|nan|inf(?:inity)?)\s*$'
+    .format(_DIGITS), re.IGNORECASE)
+
 
 class LabelParser():
     def __init__(self,
@@ -19,43 +29,44 @@ class LabelParser():
     def parse_labels(self):
         # delimiters are decided by the extension of the labels file
 
-        reader = csv.reader(open(self._filepath, newline=''),
-                            delimiter=self._delimiter)
-
-        header = next(reader)
-        first_class_index = 2 if self._timecontinuous else 1
-
-        classes = header[first_class_index:]
-
-        # a list of distinct labels is needed for deciding on the nominal class values for .arff files
-        self.labels = [[class_name, []] for class_name in classes]
-
-        # parse the label file line by line
-        for row in reader:
-            name = splitext(normpath(
-                row[0]))[0] if self._remove_extension else normpath(row[0])
-            if self._timecontinuous:
-                if name not in self.label_dict:
-                    self.label_dict[name] = {}
-                self.label_dict[name][decimal.Decimal(
-                    row[1])] = row[first_class_index:]
-            else:
-                self.label_dict[name] = row[first_class_index:]
-            for i, label in enumerate(row[first_class_index:]):
-                if self._is_number(label):
-                    self.labels[i] = (self.labels[i][0], None)
+        with open(self._filepath, newline='',
+                  buffering=READ_BUFFER_SIZE) as label_file:
+            reader = csv.reader(label_file, delimiter=self._delimiter)
+
+            header = next(reader)
+            first_class_index = 2 if self._timecontinuous else 1
+
+            classes = header[first_class_index:]
+
+            # a list of distinct labels is needed for deciding on the nominal class values for .arff files
+            numeric = [False] * len(classes)
+            nominal_labels = [set() for _ in classes]
+
+            # parse the label file line by line
+            for row in reader:
+                name = splitext(normpath(
+                    row[0]))[0] if self._remove_extension else normpath(row[0])
+                if self._timecontinuous:
+                    if name not in self.label_dict:
+                        self.label_dict[name] = {}
+                    self.label_dict[name][decimal.Decimal(
+                        row[1])] = row[first_class_index:]
                 else:
-                    self.labels[i][1].append(label)
-                    self.labels[i] = [
-                        self.labels[i][0],
-                        sorted(list(set(self.labels[i][1])))
-                    ]
+                    self.label_dict[name] = row[first_class_index:]
+                for i, label in enumerate(row[first_class_index:]):
+                    # a single numeric value makes the whole column numeric
+                    if numeric[i]:
+                        continue
+                    if self._is_number(label):
+                        numeric[i] = True
+                    else:
+                        nominal_labels[i].add(label)
+
+        self.labels = [(class_name, None) if is_numeric else
+                       [class_name, sorted(nominal_labels[i])]
+                       for i, (class_name, is_numeric) in enumerate(
+                           zip(classes, numeric))]
 
     @staticmethod
     def _is_number(s):
-        try:
-            complex(s)  # for int, long, float and complex
-        except ValueError:
-            return False
-
-        return True
+        return _NUMBER_RE.match(s) is not None
@@ -1,6 +1,7 @@
 from click.testing import CliRunner
 from deepspectrum.__main__ import cli
 from multiprocessing import cpu_count
+from os import environ
 from os.path import join, dirname
 
 cur_dir = dirname(__file__)
@@ -20,3 +21,63 @@ def test_image_features(tmpdir):
     assert 'Total params' in result.output
     assert 'Done' in result.output
     assert result.exit_code == 0
+
+
+def _extract_with_label_file(tmpdir, label_rows):
+    label_file = join(tmpdir, 'labels.csv')
+    with open(label_file, 'w') as f:
+        f.write('\n'.join(label_rows) + '\n')
+    output = join(tmpdir, 'image-features.arff')
+    runner = CliRunner()
+    result = runner.invoke(cli,
+                           args=[
+                               '-vv', 'image-features',
+                               join(examples, 'pictures'), '-np',
+                               cpu_count(), '-o', output, '-en',
+                               'squeezenet', '-lf', label_file
+                           ])
+    assert 'Done' in result.output
+    assert result.exit_code == 0
+    with open(output) as f:
+        return [line.strip() for line in f if line.startswith('@attribute')]
+
+
+def test_image_features_nan_labels(tmpdir):
+    attributes = _extract_with_label_file(tmpdir, [
+        'filename,arousal,missing', 'dog/dog.jpg,1.0,nan',
+        'seagull/seagulls.png,nan,NaN', 'seagulls/seagulls.png,-inf,inf'
+    ])
+    assert '@attribute arousal numeric' in attributes
+    assert '@attribute missing numeric' in attributes
+
+
+def test_image_features_late_numeric_label_column(tmpdir):
+    attributes = _extract_with_label_file(tmpdir, [
+        'filename,late_number', 'dog/dog.jpg,dog',
+        'seagull/seagulls.png,cat', 'seagulls/seagulls.png,2.5'
+    ])
+    assert '@attribute late_number numeric' in attributes
+
+
+def test_image_features_sorted_nominal_labels(tmpdir):
+    attributes = _extract_with_label_file(tmpdir, [
+        'filename,class', 'dog/dog.jpg,seagull', 'seagull/seagulls.png,dog',
+        'seagulls/seagulls.png,cat'
+    ])
+    assert attributes[-1] == '@attribute class {cat,dog,seagull}'
+
+
+def test_image_features_xla(tmpdir):
+    runner = CliRunner()
+    result = runner.invoke(cli,
+                           args=[
+                               '-vv', 'image-features',
+                               join(examples, 'pictures'), '-np',
+                               cpu_count(), '-o',
+                               join(tmpdir, 'image-features.csv'), '-en',
+                               'vgg16', '-el', 'justAnimals', '--xla'
+                           ])
+    assert 'Enabling XLA JIT compilation.' in result.output
+    assert '--tf_xla_cpu_global_jit' in environ['TF_XLA_FLAGS']
+    assert 'Done' in result.output
+    assert result.exit_code == 0